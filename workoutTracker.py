@@ -1,9 +1,18 @@
 import sys
 import sqlite3
+import threading
 from datetime import datetime
 
 # Make sure we import QEasingCurve so we can use setEasingCurve(QEasingCurve.InOutQuad)
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import (
+    Qt,
+    QPropertyAnimation,
+    QEasingCurve,
+    QAbstractTableModel,
+    QModelIndex,
+    QEvent,
+    Signal
+)
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,8 +23,8 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QSpinBox,
     QDoubleSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QStyledItemDelegate,
     QHeaderView,
     QMessageBox,
     QComboBox,
@@ -36,13 +45,98 @@ from PySide6.QtGui import QFontDatabase
 
 DB_NAME = "futuristic_tracker_v6.db"
 
-def initialize_db():
+# Applied to every connection the ConnectionManager opens.
+# WAL lets readers run while a writer commits; synchronous=NORMAL is still
+# crash-safe in WAL mode (only a power cut can lose the latest commits).
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",       # ~16 MB page cache (negative = KiB)
+    "PRAGMA mmap_size=268435456",     # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+)
+
+class ConnectionManager:
     """
-    Creates the necessary tables in a brand-new DB.
-    We'll store weigh_ins with (id, date, weight, height, bmi).
+    Keeps long-lived, tuned connections to one DB file instead of reconnecting
+    on every click. Each thread gets its own connection (thread-local), so the
+    GUI thread reuses a single one and background workers never share it.
     """
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
+    def __init__(self, db_name=DB_NAME, cached_statements=256):
+        self.db_name = db_name
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _open(self):
+        # check_same_thread=False only so close_all() can run at shutdown;
+        # a connection is still only ever used by the thread that opened it.
+        conn = sqlite3.connect(
+            self.db_name,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+_manager = None
+
+def get_connection():
+    """Returns this thread's persistent connection. Do not close it."""
+    global _manager
+    if _manager is None:
+        _manager = ConnectionManager(DB_NAME)
+    return _manager.connection()
+
+def close_connections():
+    global _manager
+    if _manager is not None:
+        _manager.close_all()
+        _manager = None
+
+# Bumped whenever a migration is appended to MIGRATIONS; stored in the DB
+# file itself via PRAGMA user_version. DB_NAME stays fixed: schema changes
+# upgrade the existing file in place instead of starting a new one.
+SCHEMA_VERSION = 2
+
+def _columns(c, table):
+    c.execute(f"PRAGMA table_info({table})")
+    return [row[1] for row in c.fetchall()]
+
+def _migrate_v1(c):
+    """
+    Brings an unversioned DB to the current table layout. Covers a brand-new
+    file as well as the older layouts of futuristic_tracker.db (sets keyed by
+    set_id) and futuristic_tracker_v2.db (weigh_ins without height/bmi).
+    """
+    # sets keyed by set_id: move aside, recreate below, then copy back in
+    legacy_sets = "set_id" in _columns(c, "sets")
+    if legacy_sets:
+        c.execute("ALTER TABLE sets RENAME TO sets_legacy")
+
+    # weigh_ins without height/bmi: old rows get 0, same as an unknown height
+    weigh_in_columns = _columns(c, "weigh_ins")
+    if weigh_in_columns and "height" not in weigh_in_columns:
+        c.execute("ALTER TABLE weigh_ins ADD COLUMN height FLOAT NOT NULL DEFAULT 0")
+        c.execute("ALTER TABLE weigh_ins ADD COLUMN bmi FLOAT NOT NULL DEFAULT 0")
 
     # workouts
     c.execute("""
@@ -97,11 +191,160 @@ def initialize_db():
         );
     """)
 
-    conn.commit()
-    conn.close()
+    if legacy_sets:
+        # one bulk INSERT ... SELECT; set numbers follow insertion order
+        c.execute("""
+            INSERT INTO sets (exercise_id, set_number, reps, weight)
+            SELECT exercise_id,
+                   ROW_NUMBER() OVER (PARTITION BY exercise_id ORDER BY set_id),
+                   reps, weight
+            FROM sets_legacy
+        """)
+        c.execute("DROP TABLE sets_legacy")
 
-def get_connection():
-    return sqlite3.connect(DB_NAME)
+def _migrate_v2(c):
+    """
+    Adds lookup indexes. workouts(date) and exercises(workout_id, exercise_name)
+    become UNIQUE so get-or-create can use INSERT ... ON CONFLICT ... RETURNING;
+    any duplicates written before that are merged first.
+    """
+    # point exercises of duplicate workouts at the oldest workout for that date
+    c.execute("""
+        UPDATE exercises SET workout_id = (
+            SELECT MIN(w2.workout_id)
+            FROM workouts w1
+            JOIN workouts w2 ON w2.date = w1.date
+            WHERE w1.workout_id = exercises.workout_id
+        )
+        WHERE workout_id NOT IN (SELECT MIN(workout_id) FROM workouts GROUP BY date)
+    """)
+    c.execute("""
+        DELETE FROM workouts
+        WHERE workout_id NOT IN (SELECT MIN(workout_id) FROM workouts GROUP BY date)
+    """)
+
+    # fold duplicate exercises into the oldest one, renumbering their sets
+    # after the sets it already has
+    c.execute("""
+        SELECT e.exercise_id, k.keep_id
+        FROM exercises e
+        JOIN (
+            SELECT workout_id, exercise_name, MIN(exercise_id) AS keep_id
+            FROM exercises
+            GROUP BY workout_id, exercise_name
+            HAVING COUNT(*) > 1
+        ) k ON k.workout_id = e.workout_id AND k.exercise_name = e.exercise_name
+        WHERE e.exercise_id <> k.keep_id
+        ORDER BY e.exercise_id
+    """)
+    for dup_id, keep_id in c.fetchall():
+        c.execute("SELECT COALESCE(MAX(set_number),0) FROM sets WHERE exercise_id=?",(keep_id,))
+        offset = c.fetchone()[0]
+        c.execute("""
+            UPDATE sets SET exercise_id=?, set_number=set_number+?
+            WHERE exercise_id=?
+        """,(keep_id, offset, dup_id))
+        c.execute("DELETE FROM exercises WHERE exercise_id=?",(dup_id,))
+
+    # both unique indexes also cover their lookups (the rowid is the id we want)
+    c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_workouts_date ON workouts(date)")
+    c.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_exercises_workout_name
+        ON exercises(workout_id, exercise_name)
+    """)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_weigh_ins_date ON weigh_ins(date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_nutrition_log_date ON nutrition_log(date)")
+
+# MIGRATIONS[n] upgrades a DB at user_version n-1 to n.
+MIGRATIONS = {
+    1: _migrate_v1,
+    2: _migrate_v2,
+}
+
+def migrate(conn):
+    """
+    Upgrades the DB behind conn to SCHEMA_VERSION in place, running every
+    pending migration inside one transaction. When the file is already
+    current this is a single PRAGMA read and no DDL runs.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == SCHEMA_VERSION:
+        return
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema v{version} is newer than this app (v{SCHEMA_VERSION})."
+        )
+
+    c = conn.cursor()
+    with conn:
+        c.execute("BEGIN IMMEDIATE")
+        for v in range(version+1, SCHEMA_VERSION+1):
+            MIGRATIONS[v](c)
+            c.execute(f"PRAGMA user_version={v}")
+
+def initialize_db():
+    """
+    Creates or upgrades DB_NAME to the current schema (see migrate()).
+    We'll store weigh_ins with (id, date, weight, height, bmi).
+    """
+    migrate(get_connection())
+
+def insert_sets(rows):
+    """
+    Bulk-inserts sets given as (date, exercise_name, reps, weight) tuples.
+    Workout/exercise ids and the next set number are resolved once per
+    distinct date/exercise, then every set is written with executemany in a
+    single transaction (one commit, however many rows).
+    Returns the number of sets inserted.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    workout_ids = {}
+    exercise_ids = {}
+    next_set_number = {}
+    set_rows = []
+
+    with conn:
+        # take the write lock up front so MAX(set_number) can't go stale
+        c.execute("BEGIN IMMEDIATE")
+        for date_str, ex_name, reps, weight in rows:
+            # get/create workout
+            w_id = workout_ids.get(date_str)
+            if w_id is None:
+                c.execute("""
+                    INSERT INTO workouts (date) VALUES (?)
+                    ON CONFLICT(date) DO UPDATE SET date=excluded.date
+                    RETURNING workout_id
+                """,(date_str,))
+                w_id = c.fetchone()[0]
+                workout_ids[date_str] = w_id
+
+            # get/create exercise (+ its current max set_number)
+            e_id = exercise_ids.get((w_id, ex_name))
+            if e_id is None:
+                c.execute("""
+                    INSERT INTO exercises (workout_id, exercise_name) VALUES (?,?)
+                    ON CONFLICT(workout_id, exercise_name)
+                    DO UPDATE SET exercise_name=excluded.exercise_name
+                    RETURNING exercise_id
+                """,(w_id, ex_name))
+                e_id = c.fetchone()[0]
+                c.execute("""
+                    SELECT COALESCE(MAX(set_number),0)
+                    FROM sets
+                    WHERE exercise_id=?
+                """,(e_id,))
+                next_set_number[e_id] = c.fetchone()[0]+1
+                exercise_ids[(w_id, ex_name)] = e_id
+
+            set_rows.append((e_id, next_set_number[e_id], reps, weight))
+            next_set_number[e_id] += 1
+
+        c.executemany("""
+            INSERT INTO sets (exercise_id, set_number, reps, weight)
+            VALUES (?,?,?,?)
+        """, set_rows)
+    return len(set_rows)
 
 def today_str():
     return datetime.now().strftime("%Y-%m-%d")
@@ -158,7 +401,7 @@ QPushButton:hover {
     box-shadow: 0 0 12px #0ff0fc;
 }
 
-QTableWidget {
+QTableView {
     background-color: #1C1C1C;
     color: #e0e0e0;
     gridline-color: #0ff0fc;
@@ -173,7 +416,104 @@ QHeaderView::section {
 """
 
 ###############################################################################
-# 3. PLAN DATA (Hard-coded, no CRUD)
+# 3. TABLE MODELS (paged from SQLite, painted delete action)
+###############################################################################
+
+class SqlPageModel(QAbstractTableModel):
+    """
+    Read-only table model over a SELECT that is pulled in pages of PAGE_SIZE
+    rows as the view scrolls (canFetchMore/fetchMore), so the views only ever
+    hold rows that have been scrolled to.
+
+    `sql` must end in "LIMIT ? OFFSET ?". Its first len(headers) columns are
+    displayed (minus a trailing "Delete" column, which has no data and is
+    painted by DeleteDelegate); any further columns are keys for the caller.
+    """
+    PAGE_SIZE = 200
+
+    def __init__(self, headers, sql, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.sql = sql
+        self.display_columns = len(headers) - (headers[-1] == "Delete")
+        self.rows = []
+        self.exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        if index.column() >= self.display_columns:
+            return None
+        return str(self.rows[index.row()][index.column()])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.exhausted:
+            return
+        c = get_connection().cursor()
+        c.execute(self.sql, (self.PAGE_SIZE, len(self.rows)))
+        page = c.fetchall()
+        self.exhausted = len(page) < self.PAGE_SIZE
+        if page:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first+len(page)-1)
+            self.rows.extend(page)
+            self.endInsertRows()
+
+    def reload(self):
+        """Drops every loaded row and fetches the first page again."""
+        self.beginResetModel()
+        self.rows = []
+        self.exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+class DeleteDelegate(QStyledItemDelegate):
+    """
+    Paints a bin glyph in the "Delete" column instead of giving every row its
+    own QPushButton; a click emits deleteClicked(row).
+    """
+    deleteClicked = Signal(int)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        painter.save()
+        font = painter.font()
+        font.setPixelSize(16)
+        painter.setFont(font)
+        painter.drawText(option.rect, Qt.AlignCenter, "🗑")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self.deleteClicked.emit(index.row())
+            return True
+        return False
+
+def make_table_view(model, delete_delegate=None):
+    table = QTableView()
+    table.setModel(model)
+    table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    if delete_delegate is not None:
+        table.setItemDelegateForColumn(model.columnCount()-1, delete_delegate)
+    return table
+
+###############################################################################
+# 4. PLAN DATA (Hard-coded, no CRUD)
 ###############################################################################
 WORKOUT_PLAN = {
     "Day 1: Back & Biceps (Pull 1)": [
@@ -232,7 +572,7 @@ WORKOUT_PLAN = {
 }
 
 ###############################################################################
-# 4. PLAN TAB (Checklists + "Add to Workouts")
+# 5. PLAN TAB (Checklists + "Add to Workouts")
 ###############################################################################
 
 class AddPlanExercisesDialog(QDialog):
@@ -335,57 +675,15 @@ class PlanTab(QWidget):
         dialog = AddPlanExercisesDialog(self)
         if dialog.exec() == QDialog.Accepted:
             date_str, reps_val, weight_val = dialog.get_data()
-            for ex_name in checked_exercises:
-                self.insert_exercise_to_db(date_str, ex_name, reps_val, weight_val)
+            insert_sets([
+                (date_str, ex_name, reps_val, weight_val)
+                for ex_name in checked_exercises
+            ])
             QMessageBox.information(self,"Success",
                 f"Added {len(checked_exercises)} exercise(s) to your Workouts!")
 
-    def insert_exercise_to_db(self, date_str, ex_name, reps, weight):
-        conn = get_connection()
-        c = conn.cursor()
-        # get/create workout
-        c.execute("SELECT workout_id FROM workouts WHERE date=?",(date_str,))
-        row = c.fetchone()
-        if row:
-            w_id = row[0]
-        else:
-            c.execute("INSERT INTO workouts (date) VALUES (?)",(date_str,))
-            w_id = c.lastrowid
-
-        # get/create exercise
-        c.execute("""
-            SELECT exercise_id FROM exercises
-            WHERE workout_id=? AND exercise_name=?
-        """,(w_id, ex_name))
-        e_row = c.fetchone()
-        if e_row:
-            e_id = e_row[0]
-        else:
-            c.execute("""
-                INSERT INTO exercises (workout_id, exercise_name)
-                VALUES (?,?)
-            """,(w_id, ex_name))
-            e_id = c.lastrowid
-
-        # find max set_number
-        c.execute("""
-            SELECT COALESCE(MAX(set_number),0)
-            FROM sets
-            WHERE exercise_id=?
-        """,(e_id,))
-        max_sn = c.fetchone()[0]
-        new_sn = max_sn+1
-
-        # insert
-        c.execute("""
-            INSERT INTO sets (exercise_id, set_number, reps, weight)
-            VALUES (?,?,?,?)
-        """,(e_id, new_sn, reps, weight))
-        conn.commit()
-        conn.close()
-
 ###############################################################################
-# 5. WORKOUT TAB: "Delete" Buttons (Bin icon) + Refresh
+# 6. WORKOUT TAB: "Delete" Bin column + Refresh
 ###############################################################################
 
 class WorkoutTab(QWidget):
@@ -428,47 +726,33 @@ class WorkoutTab(QWidget):
         main_layout.addWidget(btn_refresh)
 
         # Table: columns => date, exercise, set#, reps, weight, delete
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Date","Exercise","Set #","Reps","Weight","Delete"
-        ])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        main_layout.addWidget(QLabel("Recent Sets (Latest 10)"))
-        main_layout.addWidget(self.table)
-
-        self.setLayout(main_layout)
-        self.load_sets()
-
-    def load_sets(self):
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute("""
+        self.model = SqlPageModel(
+            ["Date","Exercise","Set #","Reps","Weight","Delete"],
+            """
             SELECT w.date, e.exercise_name, s.set_number, s.reps, s.weight, s.exercise_id
             FROM sets s
             JOIN exercises e ON s.exercise_id = e.exercise_id
             JOIN workouts w ON e.workout_id = w.workout_id
             ORDER BY w.date DESC, s.exercise_id DESC, s.set_number DESC
-            LIMIT 10;
-        """)
-        rows = c.fetchall()
-        conn.close()
+            LIMIT ? OFFSET ?
+            """,
+            self
+        )
+        self.delete_delegate = DeleteDelegate(self)
+        self.delete_delegate.deleteClicked.connect(self.on_delete_clicked)
+        self.table = make_table_view(self.model, self.delete_delegate)
+        main_layout.addWidget(QLabel("Recent Sets"))
+        main_layout.addWidget(self.table)
 
-        self.table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            date_val, ex_name, set_num, reps_val, weight_val, exercise_id = row
+        self.setLayout(main_layout)
+        self.load_sets()
 
-            self.table.setItem(i, 0, QTableWidgetItem(date_val))
-            self.table.setItem(i, 1, QTableWidgetItem(ex_name))
-            self.table.setItem(i, 2, QTableWidgetItem(str(set_num)))
-            self.table.setItem(i, 3, QTableWidgetItem(str(reps_val)))
-            self.table.setItem(i, 4, QTableWidgetItem(str(weight_val)))
+    def load_sets(self):
+        self.model.reload()
 
-            # Bin button to delete
-            bin_button = QPushButton("🗑")  # or an icon if you prefer
-            bin_button.setStyleSheet("QPushButton { font-size: 16px; }")
-            bin_button.clicked.connect(lambda _, e_id=exercise_id, s_n=set_num: self.delete_set(e_id, s_n))
-            self.table.setCellWidget(i, 5, bin_button)
+    def on_delete_clicked(self, row):
+        _, _, set_num, _, _, exercise_id = self.model.rows[row]
+        self.delete_set(exercise_id, set_num)
 
     def add_set(self):
         date_str = self.date_input.text().strip() or today_str()
@@ -480,48 +764,7 @@ class WorkoutTab(QWidget):
             QMessageBox.warning(self, "Error", "Exercise cannot be empty.")
             return
 
-        conn = get_connection()
-        c = conn.cursor()
-        # get/create workout
-        c.execute("SELECT workout_id FROM workouts WHERE date=?",(date_str,))
-        w_row = c.fetchone()
-        if w_row:
-            w_id = w_row[0]
-        else:
-            c.execute("INSERT INTO workouts (date) VALUES (?)",(date_str,))
-            w_id = c.lastrowid
-
-        # get/create exercise
-        c.execute("""
-            SELECT exercise_id FROM exercises
-            WHERE workout_id=? AND exercise_name=?
-        """,(w_id, ex_name))
-        e_row = c.fetchone()
-        if e_row:
-            e_id = e_row[0]
-        else:
-            c.execute("""
-                INSERT INTO exercises (workout_id, exercise_name)
-                VALUES (?,?)
-            """,(w_id, ex_name))
-            e_id = c.lastrowid
-
-        # find max set_number
-        c.execute("""
-            SELECT COALESCE(MAX(set_number),0)
-            FROM sets
-            WHERE exercise_id=?
-        """,(e_id,))
-        max_sn = c.fetchone()[0]
-        new_sn = max_sn+1
-
-        # insert
-        c.execute("""
-            INSERT INTO sets (exercise_id, set_number, reps, weight)
-            VALUES (?,?,?,?)
-        """,(e_id, new_sn, reps_val, weight_val))
-        conn.commit()
-        conn.close()
+        insert_sets([(date_str, ex_name, reps_val, weight_val)])
 
         self.exercise_input.clear()
         self.reps_input.setValue(10)
@@ -543,11 +786,10 @@ class WorkoutTab(QWidget):
                 WHERE exercise_id=? AND set_number=?
             """,(e_id,s_n))
             conn.commit()
-            conn.close()
             self.load_sets()
 
 ###############################################################################
-# 6. WEIGH-IN TAB: now with a bin button for each row
+# 7. WEIGH-IN TAB: with a bin column for each row
 ###############################################################################
 
 class WeighInTab(QWidget):
@@ -580,41 +822,30 @@ class WeighInTab(QWidget):
         main_layout.addWidget(btn_log)
 
         # Table: date, weight, height, bmi, delete
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Date","Weight","Height","BMI","Delete"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.model = SqlPageModel(
+            ["Date","Weight","Height","BMI","Delete"],
+            """
+            SELECT date, weight, height, bmi, id
+            FROM weigh_ins
+            ORDER BY date DESC
+            LIMIT ? OFFSET ?
+            """,
+            self
+        )
+        self.delete_delegate = DeleteDelegate(self)
+        self.delete_delegate.deleteClicked.connect(self.on_delete_clicked)
+        self.table = make_table_view(self.model, self.delete_delegate)
 
-        main_layout.addWidget(QLabel("Weigh-In History (Latest 10)"))
+        main_layout.addWidget(QLabel("Weigh-In History"))
         main_layout.addWidget(self.table)
         self.setLayout(main_layout)
         self.load_weigh_ins()
 
     def load_weigh_ins(self):
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute("""
-            SELECT id, date, weight, height, bmi
-            FROM weigh_ins
-            ORDER BY date DESC
-            LIMIT 10;
-        """)
-        rows = c.fetchall()
-        conn.close()
-
-        self.table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            w_id, date_val, w_kg, h_val, b_val = row
-            self.table.setItem(i, 0, QTableWidgetItem(date_val))
-            self.table.setItem(i, 1, QTableWidgetItem(str(w_kg)))
-            self.table.setItem(i, 2, QTableWidgetItem(str(h_val)))
-            self.table.setItem(i, 3, QTableWidgetItem(str(b_val)))
-
-            # Bin button to delete
-            bin_button = QPushButton("🗑")
-            bin_button.setStyleSheet("QPushButton { font-size: 16px; }")
-            bin_button.clicked.connect(lambda _, w_id_=w_id: self.delete_weigh_in(w_id_))
-            self.table.setCellWidget(i, 4, bin_button)
+        self.model.reload()
+
+    def on_delete_clicked(self, row):
+        self.delete_weigh_in(self.model.rows[row][4])
 
     def log_weight_and_bmi(self):
         date_str = self.date_input.text().strip() or today_str()
@@ -633,7 +864,6 @@ class WeighInTab(QWidget):
             VALUES (?,?,?,?)
         """,(date_str,w_kg,h_cm,bmi))
         conn.commit()
-        conn.close()
 
         self.date_input.clear()
         self.load_weigh_ins()
@@ -650,11 +880,10 @@ class WeighInTab(QWidget):
             c = conn.cursor()
             c.execute("DELETE FROM weigh_ins WHERE id=?",(w_id,))
             conn.commit()
-            conn.close()
             self.load_weigh_ins()
 
 ###############################################################################
-# 7. NUTRITION TAB
+# 8. NUTRITION TAB
 ###############################################################################
 
 class NutritionTab(QWidget):
@@ -697,33 +926,26 @@ class NutritionTab(QWidget):
         layout.addWidget(self.fat_input)
         layout.addWidget(btn_log_nutrition)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Date","Calories","Protein","Carbs","Fat"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.model = SqlPageModel(
+            ["Date","Calories","Protein","Carbs","Fat"],
+            """
+            SELECT date, calories, protein, carbs, fat
+            FROM nutrition_log
+            ORDER BY date DESC
+            LIMIT ? OFFSET ?
+            """,
+            self
+        )
+        self.table = make_table_view(self.model)
 
-        layout.addWidget(QLabel("Recent Nutrition Logs (Latest 10)"))
+        layout.addWidget(QLabel("Recent Nutrition Logs"))
         layout.addWidget(self.table)
         self.setLayout(layout)
 
         self.load_nutrition()
 
     def load_nutrition(self):
-        conn = get_connection()
-        c = conn.cursor()
-        c.execute("""
-            SELECT date, calories, protein, carbs, fat
-            FROM nutrition_log
-            ORDER BY date DESC
-            LIMIT 10;
-        """)
-        rows = c.fetchall()
-        conn.close()
-
-        self.table.setRowCount(len(rows))
-        for i,row in enumerate(rows):
-            for j,val in enumerate(row):
-                self.table.setItem(i,j,QTableWidgetItem(str(val)))
+        self.model.reload()
 
     def log_nutrition(self):
         date_str = self.date_input.text().strip() or today_str()
@@ -739,7 +961,6 @@ class NutritionTab(QWidget):
             VALUES (?,?,?,?,?)
         """,(date_str,cals,prot,carbs,fat))
         conn.commit()
-        conn.close()
 
         self.date_input.clear()
         self.calories_input.setValue(2000)
@@ -749,7 +970,7 @@ class NutritionTab(QWidget):
         self.load_nutrition()
 
 ###############################################################################
-# 8. MAIN WINDOW
+# 9. MAIN WINDOW
 ###############################################################################
 
 class FuturisticFitnessTracker(QMainWindow):
@@ -785,7 +1006,7 @@ class FuturisticFitnessTracker(QMainWindow):
         self.animation.start()
 
 ###############################################################################
-# 9. APPLICATION ENTRY
+# 10. APPLICATION ENTRY
 ###############################################################################
 
 def main():
@@ -793,6 +1014,7 @@ def main():
     initialize_db()
 
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(close_connections)
     window = FuturisticFitnessTracker()
     window.show()
     sys.exit(app.exec())